@@ -20,27 +20,52 @@ collections of files and their associated metadata.
 
 from pathlib import Path
 import os
+import re
+import sys
 import warnings
-import datetime
+import functools
+import weakref
+import shlex
+import hashlib
 
 # Importing TypedDict so that it can be used in defining
 # the parameters which label files in the catalog.
-from typing import TypedDict
-# Importing inspect so that user can give classes as arguments
-import inspect
+from typing import TypedDict, get_type_hints
+# Looking up builtin types by name
+import builtins
 
-# Importing time to wait if I run into `ScannerError`s
+# Importing time to timestamp the catalog and its files
 import time
 
+# Advisory locking, so that several jobs sharing a catalog
+# don't read it while another one is writing it
+from contextlib import contextmanager
+try:
+    import fcntl
+except ImportError:  # (e.g. on Windows: no locking)
+    fcntl = None
+
+# Deleting many files at once
+from concurrent.futures import ThreadPoolExecutor
+
 # Data cataloging
 import uuid
 import yaml
-
-# For loading catalog data:
-import dill as pickle
-
-# User input in case we find an existing file
-from pytimedinput import timedInput
+# (using the libyaml-based loader/dumper when available)
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+# Line width for the catalog `.yaml` file: effectively no
+# line wrapping (the C emitter requires an int width)
+_YAML_WIDTH = 2**31 - 1
+
+# Caching and serializing the catalog
+import pickle
+import copy
+# (`pytimedinput`, for user input in case we find an existing
+#  file, is imported only where it is used, since it is slow
+#  to import)
 
 # Logging
 import logging
@@ -51,6 +76,19 @@ LOGGER.addHandler(logging.StreamHandler())
 # =====================================
 # Utilities for Typed/Typing Parameters
 # =====================================
+# Strings which are accepted when casting to bool
+_STR_TO_BOOL = {'true': True, 't': True, '1': True,
+                'false': False, 'f': False, '0': False}
+# Separator for comma-separated strings when casting to list
+_COMMA_SPLIT_RE = re.compile(r'\s*,\s*')
+
+
+# Builtin types commonly used as parameter types
+_BUILTIN_TYPES = {builtin_type.__name__: builtin_type
+                  for builtin_type in (int, float, str, bool, list,
+                                       tuple, dict, set, bytes)}
+
+
 def get_builtin(name):
     """Gets the builtin type with the given name, if
     it exists, and throws an AttributeError otherwise.
@@ -58,18 +96,16 @@ def get_builtin(name):
     Can be used to convert strings to types, e.g.
         get_builtin("int") --> int.
 
-    The try-except statement is due to the fact
-    that __builtins__ may be either a module or
-    a dictionary, depending on context.
+    Classes (e.g. user-defined types) are returned as given.
     See
         https://docs.python.org/3/library/builtins.html
     """
-    if inspect.isclass(name):
+    if isinstance(name, type):
         return name
-    try:
-        return __builtins__[name]
-    except TypeError:
-        return getattr(__builtins__, name)
+    builtin_type = _BUILTIN_TYPES.get(name)
+    if builtin_type is not None:
+        return builtin_type
+    return getattr(builtins, name)
 
 
 def stringdict_to_typeddict(name, stringdict):
@@ -88,8 +124,23 @@ def stringdict_to_typeddict(name, stringdict):
             b: str
             c: float
     """
+    # (re-using the class made for the same name and types,
+    #  e.g. when the same catalog is loaded again)
+    try:
+        return _cached_typeddict(name, tuple(stringdict.items()))
+    except TypeError:
+        # (types which cannot be hashed)
+        return TypedDict(name, {key: get_builtin(value)
+                                for key, value in stringdict.items()})
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_typeddict(name, items):
+    """Cached `stringdict_to_typeddict`, for the `(key, type)`
+    items of a dictionary.
+    """
     return TypedDict(name, {key: get_builtin(value)
-                            for key, value in stringdict.items()})
+                            for key, value in items})
 
 
 def typeddict_to_stringdict(typeddict):
@@ -107,6 +158,75 @@ def typeddict_to_stringdict(typeddict):
             in typeddict.__annotations__.items()}
 
 
+# Cached `_typeddict_schema` results, which do not keep
+# (rebuilt, discarded) TypedDict classes alive
+_TYPEDDICT_SCHEMAS = weakref.WeakKeyDictionary()
+
+
+def _typeddict_schema(typeddict):
+    """Returns the expected keys and the `(key, type)` pairs
+    of a TypedDict class.
+
+    The result is cached per class, so that repeated casts
+    against the same TypedDict (e.g. for every file in a
+    catalog) do not rebuild them. TypedDict classes should
+    therefore be rebuilt rather than having their
+    `__annotations__` modified in place.
+
+    Uses `typing.get_type_hints`, so that string/forward-reference
+    annotations (e.g. from `from __future__ import annotations`)
+    are resolved to the types they refer to.
+    """
+    schema = _TYPEDDICT_SCHEMAS.get(typeddict)
+    if schema is not None:
+        return schema
+
+    try:
+        annotations = get_type_hints(typeddict)
+    except (NameError, TypeError):
+        # Annotations which cannot be resolved are used as given
+        annotations = typeddict.__annotations__
+    schema = frozenset(annotations), tuple(annotations.items())
+    _TYPEDDICT_SCHEMAS[typeddict] = schema
+    return schema
+
+
+class _KeyMismatchError(ValueError):
+    """ValueError raised when the keys given to `cast_as_typeddict`
+    do not match the keys expected by the TypedDict.
+
+    The message, which includes the differences between the
+    expected and found keys, is only built if the error is
+    actually displayed.
+    """
+    def __init__(self, tdict_name, expected_keys, found_keys,
+                 allow_undeclared_keys):
+        super().__init__(tdict_name, expected_keys, found_keys,
+                         allow_undeclared_keys)
+        self.tdict_name = tdict_name
+        self.expected_keys = set(expected_keys)
+        self.found_keys = set(found_keys)
+        self.allow_undeclared_keys = allow_undeclared_keys
+
+    def __str__(self):
+        message = (f"Expected keys for {self.tdict_name}:"
+                   f"\n\t{self.expected_keys}."
+                   f"\nFound keys:\n\t{self.found_keys}")
+        if not self.allow_undeclared_keys:
+            return (message
+                    + "\n\nFound-Expected:"
+                    f"\n\t{self.found_keys - self.expected_keys}"
+                    "\nExpected-Found:"
+                    f"\n\t{self.expected_keys - self.found_keys}\n\n"
+                    "(The option `allow_undeclared_keys` can be set to "
+                    "True to allow extra keys that were not expected).")
+        return (message
+                + "\nExpected-Found:"
+                f"\n\t{self.expected_keys - self.found_keys}\n\n"
+                "(The option `allow_undeclared_keys` can be set to "
+                "False to prevent extra keys that were not expected).")
+
+
 def cast_as_typeddict(dictionary, typeddict,
                       defaults=None,
                       allow_undeclared_keys=False):
@@ -126,106 +246,85 @@ def cast_as_typeddict(dictionary, typeddict,
     if defaults is None:
         defaults = {}
 
-    keys_with_defaults = set(defaults.keys())
-
     # If we are not given a TypedDict for type checking
     # we must "allow extra keys" because we expect
     # no keys by default
     if typeddict is None:
         if allow_undeclared_keys:
-            result = defaults
-            result.update(dictionary)
-            return result
+            # (merging into a new dict, so that the given
+            #  defaults are not modified)
+            return {**defaults, **dictionary}
         # Otherwise, raise an error
         raise ValueError("Must specify a TypedDict "
                          "class for typechecking if "
                          "allow_undeclared_keys is False.")
 
     # Expected and given dictionary keys
-    expected_keys = set(typeddict.__annotations__.keys())
-    found_keys = set(dictionary.keys())
+    expected_keys, annotation_items = _typeddict_schema(typeddict)
+    found_keys = dictionary.keys()
     tdict_name = typeddict.__name__
 
     # (the keys with default values are not required)
-    all_given_keys = found_keys.union(keys_with_defaults)
+    all_given_keys = found_keys | defaults.keys()
 
     if not allow_undeclared_keys:
         # If we only accept the pre-defined keys
         # defined for the typeddict
         if expected_keys != all_given_keys:
-            raise ValueError(
-                f"Expected keys for {tdict_name}:"
-                f"\n\t{expected_keys}."
-                f"\nFound keys:\n\t{found_keys}"
-                "\n\nFound-Expected:"
-                f"\n\t{found_keys - expected_keys}"
-                "\nExpected-Found:"
-                f"\n\t{expected_keys - found_keys}\n\n"
-                "(The option `allow_undeclared_keys` can be set to True "
-                "to allow extra keys that were not expected)."
-            )
+            raise _KeyMismatchError(tdict_name, expected_keys,
+                                    found_keys, allow_undeclared_keys)
     else:
         if not expected_keys.issubset(all_given_keys):
             # If we allow extra keys, then we only check that
             # the expected keys are a subset of the found keys
-            raise ValueError(
-                f"Expected keys for {tdict_name}:"
-                f"\n\t{expected_keys}."
-                f"\nFound keys:\n\t{found_keys}"
-                "\nExpected-Found:"
-                f"\n\t{expected_keys - found_keys}\n\n"
-                "(The option `allow_undeclared_keys` can be set to False "
-                "to prevent extra keys that were not expected)."
-            )
+            raise _KeyMismatchError(tdict_name, expected_keys,
+                                    found_keys, allow_undeclared_keys)
 
     # Cast the dictionary to a typeddict and
     # check type validity element by element
-    result = typeddict()
-
-    # Putting in default values
-    for key, value in defaults.items():
-        result[key] = value
-
-    # Putting in given/found values
-    for key, value in dictionary.items():
-        result[key] = value
+    # (at runtime, TypedDict instances are plain dicts,
+    #  so we build one directly from the default values
+    #  and the given/found values)
+    result = {**defaults, **dictionary}
 
     # Performing type checking/type converting for
     # any of the given keys which are defined within
     # the typeddict
-    for key, keytype in typeddict.__annotations__.items():
-        if keytype == get_builtin(bool) and \
-                isinstance(result[key], str):
-            if result[key].lower() in ['true', 't', '1']:
-                result[key] = True
-            elif result[key].lower() in ['false', 'f', '0']:
-                result[key] = False
+    for key, keytype in annotation_items:
+        value = result[key]
+        # (nothing to do for values which already have the
+        #  expected type, e.g. parameters configured before)
+        if type(value) is keytype:
+            continue
+
+        if keytype is bool and isinstance(value, str):
+            bool_value = _STR_TO_BOOL.get(value.lower())
+            if bool_value is not None:
+                result[key] = bool_value
             else:
                 raise ValueError("Invalid value "
-                    f"{result[key]} for casting"
+                    f"{value} for casting"
                     " to bool.")
-        elif keytype == get_builtin(list):
-            if isinstance(result[key], str):
-                if ',' in result[key]:
-                    result[key] = [val.strip() for val in
-                                  result[key].split(',')]
+        elif keytype is list:
+            if isinstance(value, str):
+                if ',' in value:
+                    result[key] = _COMMA_SPLIT_RE.split(value.strip())
                 else:
-                    result[key] = result[key].split(' ')
-            elif not isinstance(result[key], list):
-                result[key] = list([result[key]])
-        else:
+                    result[key] = value.split(' ')
+            elif not isinstance(value, list):
+                result[key] = [value]
+        elif value is not None:
             try:
-                if result[key] is not None:
-                    result[key] = keytype(result[key])
+                result[key] = keytype(value)
             except ValueError as exc:
                 raise ValueError(f"Invalid type for {key}: "
                                  f"Expected {keytype}, "
-                                 f"found {type(result[key])}") \
+                                 f"found {type(value)}") \
                       from exc
             except TypeError as exc:
                 raise TypeError(f"Attempted invalid type-cast: "
                                 "(Attempted to cast "
-                                f"value={result[key]} of {key=} "
+                                f"value={value} of {key=} "
                                 f"as {keytype=})") \
                       from exc
 
@@ -238,14 +337,21 @@ def cast_as_typeddict(dictionary, typeddict,
 # --------------------------------
 # Misc. Utilities
 # --------------------------------
+# Types of the containers most often given to `equals_or_in`
+_CONTAINER_TYPES = (list, tuple, set, frozenset)
+
+
 def equals_or_in(value, values, list_equals=False):
     """Check if a value is equal to or in a list of values.
 
     If `list_equals` is True, then the value is considered
     equal to the list of values if it is equal to the entire list .
     """
-    if hasattr(values, '__iter__') and \
-            not isinstance(values, str):
+    # (checking the common container types first, before
+    #  the general check for non-string iterables)
+    if isinstance(values, _CONTAINER_TYPES) or \
+            (not isinstance(values, str)
+             and hasattr(values, '__iter__')):
         if list_equals:
             return value == values
         return value in values
@@ -257,41 +363,85 @@ def equals_or_in(value, values, list_equals=False):
 
 
 def dictdiff(dict1, dict2):
-    """Returns the difference between two dicts."""
-    set1 = set(dict1.items())
-    set2 = set(dict2.items())
-    return set1.symmetric_difference(set2)
+    """Returns the difference between two dicts: a list of the
+    `(key, value)` pairs of either dict which are not in the other.
+
+    (Values are compared with `==`, so they need not be hashable.)
+    """
+    diff = [(key, value) for key, value in dict1.items()
+            if key not in dict2 or dict2[key] != value]
+    diff.extend((key, value) for key, value in dict2.items()
+                if key not in dict1 or dict1[key] != value)
+    return diff
 
 
 # ---------------------------------
 # Catalog file utilities:
 # ---------------------------------
+@functools.lru_cache(maxsize=128)
+def _filename_affixes(label, file_extension):
+    """Returns the (prefix, suffix) surrounding the unique id in
+    filenames for the given data name and file extension.
+    """
+    prefix = label.replace(' ', '-') + '_'
+    if file_extension is None:
+        return prefix, ''
+    return prefix, '.' + file_extension.lstrip('.')
+
+
 def unique_filename(label, folder, file_extension):
     """Generate a unique filename for a given data name."""
-    label = label.replace(' ', '-')
-    unique_id = str(uuid.uuid4())
-
     # Setting up the filename
-    if file_extension is None:
-        filename = f"{label}_{unique_id}"
-    else:
-        file_extension = file_extension.lstrip('.')
-        filename = f"{label}_{unique_id}.{file_extension}"
+    prefix, suffix = _filename_affixes(label, file_extension)
+    filename = prefix + uuid.uuid4().hex + suffix
 
     # Returning the filepath
     # (includes the folder if it is not None)
-    if folder is None:
-        folder = ''
+    if not folder:
+        return filename
     return os.path.join(folder, filename)
 
 
+# Types of parameter values which can be used (along with the
+# value itself) to cache quantities derived from parameters
+_CACHEABLE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _cache_key(param_dict):
+    """Returns a hashable key for a dict of parameters, or None if
+    the parameters cannot be cached (e.g. list-valued parameters).
+    """
+    # (using the types and the written form of the values rather
+    #  than the values themselves, since values which compare
+    #  equal may be written differently, e.g. 1 == 1.0 == True
+    #  and 0.0 == -0.0)
+    if not all(type(value) in _CACHEABLE_TYPES
+               for value in param_dict.values()):
+        return None
+    return frozenset((key, type(value), str(value))
+                     for key, value in param_dict.items())
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_yaml_key(cache_key, pair_separator, item_separator):
+    """Cached `dict_to_yaml_key`, for parameters with a cache key."""
+    return item_separator.join([
+                    f"{key}{pair_separator}{value}"
+                    for key, _, value in sorted(cache_key)])
+
+
 def dict_to_yaml_key(param_dict, pair_separator=' : ',
                      item_separator=' | '):
     """Takes a dictionary of parameters and turns it into a
     string that can be used as a key in a yaml file.
     """
+    cache_key = _cache_key(param_dict)
+    if cache_key is not None:
+        return _cached_yaml_key(cache_key, pair_separator,
+                                item_separator)
+
     yaml_key = item_separator.join([
-                    pair_separator.join([str(key), str(value)])
+                    f"{key}{pair_separator}{value}"
                     for key, value in sorted(param_dict.items())])
     return yaml_key
 
@@ -302,60 +452,89 @@ def ask_to_overwrite(name, default, timeout=10,
     dir, etc.
     """
     default = default[0].lower()
+    prompt = ("\t(v)iew\t(o)verwrite\t(s)kip\t(c)ancel"
+              + f"\n\t(current default: {default})\n\t")
+
+    from pytimedinput import timedInput
+    # Asking until we get a valid answer
+    while True:
+        user_text, timed_out = timedInput(prompt, timeout=timeout)
+        logger.info("\n\n")
+
+        if timed_out:
+            user_text = default
+
+        if user_text == 'v':
+            logger.info("Opening for viewing...")
+            os.system("open " + shlex.quote(str(name)))
+            continue
+        if user_text == 'o':
+            return True
+        if user_text == 's':
+            return False
+        if user_text == 'c':
+            raise KeyboardInterrupt
 
-    user_text, timed_out = timedInput(
-            "\t(v)iew\t(o)verwrite\t(s)kip\t(c)ancel"
-            + f"\n\t(current default: {default})\n\t",
-            timeout=timeout)
-    logger.info("\n\n")
-
-    if timed_out:
-        user_text = default
-
-    if user_text == 'v':
-        logger.info("Opening for viewing...")
-        os.system("open "+
-                  f"{name}".replace(" ", r"\ ").\
-                      replace("(", r"\(").replace(")", r"\)")
-                 )
-        return ask_to_overwrite(name, default, timeout)
-    if user_text == 'o':
-        return True
-    if user_text == 's':
-        return False
-    if user_text == 'c':
-        raise KeyboardInterrupt
-
-    logger.info("Invalid input. Please try again.")
-    return ask_to_overwrite(name, default, timeout)
+        logger.info("Invalid input. Please try again.")
 
 
 # ---------------------------------
 # Catalog param/key utilities:
 # ---------------------------------
+def register_labels(labels):
+    """Returns the given labels (e.g. the recognized data names
+    or file extensions of a catalog) as a frozenset which can be
+    passed to `check_if_recognized`.
+
+    String labels are interned, so that lookups of labels which
+    are also interned (such as string literals) are typically
+    decided by identity rather than by comparing characters.
+    """
+    return frozenset(sys.intern(label) if isinstance(label, str)
+                     else label
+                     for label in labels)
+
+
 def check_if_recognized(label, recognized_labels,
                         classification="data type",
                         default_action="warn"):
     """Check if the data type is in a set of recognized
     data types.
+
+    `recognized_labels` may be any container; passing a set
+    or frozenset (see `register_labels`) makes the membership
+    check O(1).
     """
     recognized = (label in recognized_labels)
-    if default_action == "ignore":
+    # Nothing else to do for recognized labels, or if
+    # we are ignoring unrecognized labels
+    if recognized or default_action == "ignore":
         return recognized
     if default_action == "warn":
-        if not recognized:
-            warnings.warn(f"Unrecognized {classification}: {label}"
-                          f"\n\t(Recognized {classification}s: "
-                          f"{recognized_labels})")
+        warnings.warn(f"Unrecognized {classification}: {label}"
+                      f"\n\t(Recognized {classification}s: "
+                      f"{recognized_labels})")
         return recognized
     assert recognized, f"Unrecognized {classification}: {label}"\
         + "\n\t(Recognized classifications: "\
         + f"{recognized_labels})"
 
 
+@functools.lru_cache(maxsize=1)
+def _format_time(seconds):
+    """Formats the given (whole) number of seconds since the
+    epoch as a local time, YYYY-MM-DD HH:MM:SS.
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+
+
 def now():
-    """Returns the current time in a standard format."""
-    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    """Returns the current time in a standard format
+    (YYYY-MM-DD HH:MM:SS).
+    """
+    # (formatting only once per second, e.g. when adding
+    #  many files at once)
+    return _format_time(int(time.time()))
 
 
 # =====================================
@@ -365,6 +544,17 @@ def now():
 # (freeing up None)
 sentinel = object()
 
+# Number of files above which `Catalog.purge` deletes
+# files from several threads at once
+PARALLEL_DELETE_THRESHOLD = 32
+
+# Maximum number of configured parameter dicts each catalog keeps
+_CONFIGURED_CACHE_SIZE = 1024
+
+# Environment variable which, if set, replaces `load='ask'`
+# (e.g. `LIBRARIAN_LOAD_DEFAULT=always` for batch jobs)
+LOAD_DEFAULT_ENV_VAR = 'LIBRARIAN_LOAD_DEFAULT'
+
 class Catalog:
     """In the Catalog class, we have an __init__ method that initializes
     the catalog with a given name and an empty list to store the file
@@ -410,7 +600,7 @@ class Catalog:
         # __str__
         #     yaml header
         # as_dict
-        #     A dict containing all the info of the catalog
+        #     A copy of a dict containing all the info of the catalog
         # name
         #     Name of the catalog
         # dir
@@ -503,6 +693,24 @@ class Catalog:
         # default_parameters
         #     Default values of all parameters
     """
+    # Fixed set of instance attributes
+    # (no per-instance __dict__, and faster attribute access)
+    __slots__ = (
+        # Global catalog information
+        '_catalog_name', '_catalog_dir', '_catalog_path', '_lock_path',
+        '_cache_path', '_cache_yaml',
+        # Behavior of this instance of the catalog
+        '_overwrite_behavior', '_timeout', '_configure',
+        '_verbose', 'logger',
+        '_add_warn_behavior', '_lookup_warn_behavior',
+        '_allow_undeclared_parameters',
+        # Catalog contents
+        '_catalog_dict', '_typedparameterdict',
+        '_entries', '_yaml_keys',
+        '_recognized_names', '_recognized_extensions',
+        # Bookkeeping
+        '_configured_params', '_dirty', '_batch_depth', '_saved_digest',
+    )
 
 
     # ####################################
@@ -524,6 +732,8 @@ class Catalog:
         self._catalog_name = catalog_name
         self._catalog_dir = Path(catalog_dir)
         self._catalog_path = self._catalog_dir / f"{catalog_name}.yaml"
+        self._lock_path = self._catalog_dir / f".{catalog_name}.lock"
+        self._cache_path = self._catalog_dir / f".{catalog_name}.cache.pkl"
 
         # ---------------------------------
         # Information for this instance of the catalog
@@ -534,9 +744,31 @@ class Catalog:
 
         # Whether to always configure parameters by default
         self._configure = kwargs.pop('configure', True)
+        # Whether to keep a binary cache of the catalog .yaml file
+        # (off by default; see `load()`)
+        self._cache_yaml = kwargs.pop('cache_yaml', False)
+        # Previously configured parameters, by `_cache_key` of the
+        # parameters and of the default parameters, and by the
+        # TypedDict class of the catalog (see `configure_parameters`)
+        self._configured_params = {}
+        # Number of enclosing `batch()` blocks, within which
+        # `save()` does not write to disk
+        self._batch_depth = 0
+        # Digest of the contents of the catalog when it was last
+        # saved (None if unknown; see `save()`)
+        self._saved_digest = None
 
         # Verbosity
         self._verbose = kwargs.pop('verbose', 10)
+
+        # Behavior for unrecognized data names/file extensions,
+        # when adding files and when looking them up
+        self._add_warn_behavior = ("error" if self._verbose > 20
+                                   else "warn" if self._verbose > 10
+                                   else "ignore")
+        self._lookup_warn_behavior = ("error" if self._verbose >= 20
+                                      else "warn" if self._verbose >= 10
+                                      else "ignore")
         self.logger = kwargs.pop('logger', LOGGER)
 
         # Strictness when parsing parameters
@@ -581,10 +813,20 @@ class Catalog:
         # ---------------------------------
         # Whether/when to load the catalog from
         # an existing .yaml file
+        if load == 'ask':
+            load = os.environ.get(LOAD_DEFAULT_ENV_VAR, load)
+        # (not waiting on a prompt nobody can answer,
+        #  e.g. in batch jobs)
+        if load == 'ask' and (sys.stdin is None
+                              or not sys.stdin.isatty()):
+            load = 'always'
         assert load in ['required', 'always', 'ask', 'never'], \
             "`load` must be one of 'required', 'always', 'ask', or 'never'" \
             + f", not '{load}'."
 
+        if load == 'ask':
+            from pytimedinput import timedInput
+
         # Load catalog if it exists
         # and if we might want to load
         # the catalog
@@ -654,7 +896,11 @@ class Catalog:
                 val = val.split(',')
                 val = [v.strip() for v in val]
             key = key.replace('_', ' ')
-            self._catalog_dict[key] = val
+            # (stored as a list, so that it is saved as a yaml list
+            #  and can be read back without any parsing)
+            self._catalog_dict[key] = list(val)
+
+        self._register_labels()
 
         self._catalog_dict['description'] = kwargs.pop('description')
 
@@ -662,16 +908,19 @@ class Catalog:
             self._catalog_dict[data_label] = {}
 
         # Additional properties
-        self._catalog_dict.update(kwargs)
+        creation_time = now()
         self._catalog_dict.update({
+                **kwargs,
                 'name': self._catalog_name,
                 'directory': str(self._catalog_dir),
                 'yaml location': str(self._catalog_path),
-                'creation time': str(now()),
-                'last modified': str(now()),
-                'files': [],
-                '(data_label, parameter) pairs': [],
+                'creation time': creation_time,
+                'last modified': creation_time,
          })
+        # Files in the catalog, and their data labels and parameters
+        self._entries = {}
+        # (and the yaml keys of the files)
+        self._yaml_keys = {}
 
         # ---------------------------------
         # How parameters are handled
@@ -687,8 +936,7 @@ class Catalog:
         if default_parameters is not None:
             assert isinstance(default_parameters, dict),\
                 "default_parameters must be a dictionary."
-            assert set(default_parameters.keys()).issubset(
-                    set(parameters.keys())),\
+            assert default_parameters.keys() <= parameters.keys(),\
                 "Parameters with default values must be a subset of "\
                 "the given expected parameters."
             self._catalog_dict['default parameters'] =\
@@ -701,6 +949,7 @@ class Catalog:
         # Saving
         # ---------------------------------
         self.mkdir()
+        self._dirty = True
         self.save()
 
 
@@ -714,8 +963,13 @@ class Catalog:
         return self.yaml_header()
 
     def as_dict(self):
-        """Return the catalog as a dictionary."""
-        return self._catalog_dict
+        """Return a copy of the catalog as a dictionary.
+
+        The dictionary is a deep copy: changing it (including its
+        nested dicts, e.g. 'default parameters') does not change
+        the catalog. Use the methods of the catalog to modify it.
+        """
+        return copy.deepcopy(self._serializable_dict())
 
     def name(self):
         """Returns the catalog name."""
@@ -760,139 +1014,350 @@ class Catalog:
     # =====================================
     # Saving and loading
     # =====================================
-    def save(self):
-        """Save the catalog to the catalog .yaml file."""
+    @contextmanager
+    def _locked(self, exclusive):
+        """Holds an advisory lock on the catalog: shared for
+        reading, exclusive for writing. Does nothing on platforms
+        without `fcntl`.
+        """
+        if fcntl is None:
+            yield
+            return
+
+        # Locking a separate file, so that the lock is not tied to
+        # the (rewritten) catalog file itself
+        try:
+            lock_file = self._open_lock_file(exclusive)
+        except OSError as exc:
+            if exclusive:
+                raise
+            # (e.g. reading a catalog in a directory we cannot write
+            #  to, which has no lock file we can open: reading
+            #  without a lock rather than failing to load)
+            self.logger.debug(f"Unable to lock the {self._catalog_name} "
+                              f"catalog for reading:\n\t{exc}")
+            yield
+            return
+
+        with lock_file:
+            fcntl.flock(lock_file,
+                        fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+    def _open_lock_file(self, exclusive):
+        """Opens the lock file of the catalog, creating it if needed.
+        For shared (reading) locks, an existing lock file is opened
+        read-only, so that it need not be writable.
+        """
+        if not exclusive:
+            try:
+                return open(self._lock_path, 'r', encoding='utf8')
+            except FileNotFoundError:
+                pass
+        return open(self._lock_path, 'a', encoding='utf8')
+
+
+    def save(self, force: bool = False):
+        """Save the catalog to the catalog .yaml file, if it has
+        changed since it was last saved or loaded.
+
+        Within `batch()`, saving is deferred to the end of the
+        batch unless `force` is True.
+        """
+        if not self._dirty or (self._batch_depth and not force):
+            return
+
+        # Skipping the write if the catalog was marked as changed,
+        # but its contents (apart from the time of the last
+        # modification) are the same as when it was last saved
+        catalog_dict = self._serializable_dict()
+        catalog_dict.pop('last modified', None)
+        digest = hashlib.blake2b(
+            pickle.dumps(catalog_dict, protocol=pickle.HIGHEST_PROTOCOL)
+        ).digest()
+        if digest == self._saved_digest:
+            self._dirty = False
+            return
+
         # Update the yaml header
-        self._catalog_dict['last modified'] = str(now())
+        self._catalog_dict['last modified'] = \
+            catalog_dict['last modified'] = now()
+
+        # (writing to a temporary file and then replacing the
+        #  catalog file, so that the catalog file is never seen
+        #  half-written, even by readers which do not lock it)
+        temp_path = self._catalog_path.with_name(
+            f"{self._catalog_path.name}.{os.getpid()}.tmp")
+        # Add a comment containing the header to the yaml file,
+        # followed by the catalog
+        yaml_bytes = (self.yaml_header()
+                      + yaml.dump(catalog_dict, Dumper=SafeDumper,
+                                  width=_YAML_WIDTH)).encode('utf8')
+        with self._locked(exclusive=True):
+            try:
+                with open(temp_path, 'wb') as catalog:
+                    catalog.write(yaml_bytes)
+                os.replace(temp_path, self._catalog_path)
+            except BaseException:
+                temp_path.unlink(missing_ok=True)
+                raise
+            # Keep the cache up to date, so that loading the catalog
+            # does not need to parse the .yaml file we just wrote
+            if self._cache_yaml:
+                self._write_cache(catalog_dict,
+                                  hashlib.blake2b(yaml_bytes).digest())
+        self._dirty = False
+        self._saved_digest = digest
+
+
+    @contextmanager
+    def batch(self):
+        """Context manager which defers saving the catalog until the
+        end of the block, so that many changes (e.g. adding many
+        files) write the catalog `.yaml` file only once.
+
+        If the block raises an exception, the catalog is not saved
+        at the end of the block; the changes made within it remain
+        in memory, and are only written by a later `save()`.
+
+        `with catalog:` is the same as `with catalog.batch():`.
+        """
+        with self:
+            yield self
 
-        with open(self._catalog_path, 'w', encoding='utf8') as catalog:
-            # Add a comment containing the header to the yaml file
-            catalog.write(self.yaml_header())
-            # Save the catalog
-            yaml.safe_dump(self._catalog_dict, catalog,
-                           width=float("inf"))
+
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._batch_depth -= 1
+        # (not writing a batch which was interrupted by an error)
+        if exc_type is None:
+            self.save()
 
 
     def load(self):
-        """Load the catalog from the catalog .yaml file."""
-        open_attempts = 0
-        scanner_error = None
+        """Load the catalog from the catalog .yaml file.
 
-        while open_attempts < 12:
-            with open(self._catalog_path, 'r', encoding='utf8') as catalog:
-                try:
-                    # Open the catalog
-                    loaded_catalog = yaml.safe_load(catalog)
-
-                    # Access the loaded information
-                    self._catalog_dict = loaded_catalog
-
-                    # Setting up recognized names/extensions
-                    for key in ['recognized names',
-                                'recognized extensions']:
-                        val = loaded_catalog.get(key)
-                        if isinstance(val, str):
-                            val = val.lstrip('[').rstrip(']')
-                            val = val.split(',')
-                            val = [v.strip() for v in val]
-                            self._catalog_dict[key] = val
-
-                    # Set up the catalog's TypedDict class
-                    self._typedparameterdict = \
-                        self._catalog_dict.get('parameter types')
-                    if self._typedparameterdict is not None:
-                        self._typedparameterdict = \
-                            stringdict_to_typeddict(
-                                f"{self._catalog_name}_parameters",
-                                self._typedparameterdict
-                            )
-
-                    self._catalog_dict['default parameters'] = \
-                        self._catalog_dict.get('default parameters')
-                    # Should never be None, since it is
-                    # initialized to {}
-                    assert self._catalog_dict['default parameters'] is not None,\
-                        "Catalog must have a (possibly empty) "\
-                        "dict of default parameters."
-                    return
+        If the catalog was created with `cache_yaml=True`, uses
+        the binary cache written when the catalog was last saved,
+        if its contents match the .yaml file. The cache is a
+        pickle: only enable it for catalog directories whose
+        contents you trust.
+        """
+        yaml_bytes = self._read_yaml()
+        loaded_catalog = None
+        if self._cache_yaml:
+            loaded_catalog = self._read_cache(
+                hashlib.blake2b(yaml_bytes).digest())
+        if loaded_catalog is None:
+            loaded_catalog = yaml.load(yaml_bytes, Loader=SafeLoader)
+        self._use_catalog_dict(loaded_catalog)
+
+
+    def _use_catalog_dict(self, catalog_dict):
+        """Sets up the catalog from a dict of its contents, as
+        stored in the catalog .yaml file.
+        """
+        # Access the loaded information
+        self._catalog_dict = catalog_dict
+        self._index_files()
+        self._dirty = False
+        self._saved_digest = None
+
+        # Setting up recognized names/extensions
+        # (always saved as lists; see `__init__`)
+        self._register_labels()
 
-                except yaml.scanner.ScannerError as error:
-                    # Sometimes I run into `ScannerError`s when
-                    # I try to run multiple jobs at once.
-                    # I wonder if it's because two jobs are both trying
-                    # to load and modify the data in the catalog file.
-                    # Ideally, this would never happen, but if it does,
-                    # just wait a bit and try again.
-                    self.logger.error("\nRan into a ScannerError when "
-                                 "attempting to load catalog. "
-                                 "Waiting before attempting again.")
-                    # Keep trying for 12 attempts/60s total
-                    open_attempts += 1
-                    time.sleep(5)
-                    scanner_error = error
-        raise yaml.scanner.ScannerError(scanner_error)
+        # Set up the catalog's TypedDict class
+        self._typedparameterdict = \
+            self._catalog_dict.get('parameter types')
+        if self._typedparameterdict is not None:
+            self._typedparameterdict = \
+                stringdict_to_typeddict(
+                    f"{self._catalog_name}_parameters",
+                    self._typedparameterdict
+                )
+
+        self._catalog_dict['default parameters'] = \
+            self._catalog_dict.get('default parameters')
+        # Should never be None, since it is
+        # initialized to {}
+        assert self._catalog_dict['default parameters'] is not None,\
+            "Catalog must have a (possibly empty) "\
+            "dict of default parameters."
+
+
+    def _read_yaml(self):
+        """Returns the (unparsed) contents of the catalog .yaml
+        file.
+        """
+        # (the catalog file is replaced atomically when saved, so
+        #  it is never read half-written; see `save()`)
+        with self._locked(exclusive=False), \
+                open(self._catalog_path, 'rb') as catalog:
+            return catalog.read()
+
+
+    # ---------------------------------
+    # Cache of the catalog .yaml file
+    # ---------------------------------
+    # An opt-in (`cache_yaml=True`) binary copy of the contents
+    # of the catalog .yaml file, which is much faster to load than
+    # the yaml itself. It is only written when the catalog is saved.
+    # The .yaml file remains the (human-readable) record of the
+    # catalog; the cache is only used if it was written for the
+    # exact contents (by digest) of the current .yaml file.
+    def _read_cache(self, yaml_digest):
+        """Returns the catalog dict stored in the cache of the
+        catalog, or None if there is no cache for the .yaml file
+        with the given digest.
+        """
+        try:
+            with open(self._cache_path, 'rb') as cache:
+                cached_digest, catalog_dict = pickle.load(cache)
+        except (OSError, EOFError, TypeError, ValueError,
+                pickle.UnpicklingError):
+            return None
+        if cached_digest != yaml_digest:
+            return None
+        return catalog_dict
+
+
+    def _write_cache(self, catalog_dict, yaml_digest):
+        """Stores the given catalog dict, saved in the catalog
+        .yaml file with the given digest, in the cache of the
+        catalog.
+        """
+        # (writing to a temporary file first, so that the cache is
+        #  never read while half-written)
+        temp_path = self._cache_path.with_name(
+            f"{self._cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, 'wb') as cache:
+                pickle.dump((yaml_digest, catalog_dict), cache,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._cache_path)
+        except (OSError, pickle.PicklingError) as exc:
+            self.logger.debug(f"Unable to cache the {self._catalog_name} "
+                              f"catalog:\n\t{exc}")
+            temp_path.unlink(missing_ok=True)
 
 
     def yaml_header(self):
         """Make the header for the catalog file."""
-        yaml_header = "# ==========================================\n"
-        yaml_header += f"# Catalog for {self._catalog_dict['name']}\n"
-        yaml_header += "# ==========================================\n"
-        yaml_header += f"# Description:\n"
-        yaml_header += f"#\t{self._catalog_dict['description']}\n\n"
-        yaml_header += "# ---------------------------------\n"
-        yaml_header += "# Metadata:\n"
-        yaml_header += "# ---------------------------------\n"
-        yaml_header += "#\t- Catalog `.yaml` File Location:\n"
-        yaml_header += f"#\t\t{self._catalog_dict['yaml location']}\n"
-        yaml_header += "#\t- Recognized Names: \n"
-        yaml_header += f"#\t\t{self._catalog_dict['recognized names']}\n"
-        yaml_header += "#\t- Recognized Extensions:\n"\
-                       f"#\t\t{self._catalog_dict['recognized extensions']}\n"
-        yaml_header += "#\t- Created: "\
-                       f"{self._catalog_dict['creation time']}\n"
-        yaml_header += "#\t- Last Modified: "\
-                       f"{self._catalog_dict['last modified']}\n\n"
-        yaml_header += "# ---------------------------------\n"
-        yaml_header += "# Expected Parameters:\n"
-        yaml_header += "# ---------------------------------\n"
+        catalog_dict = self._catalog_dict
+        header_lines = [
+            "# ==========================================",
+            f"# Catalog for {catalog_dict['name']}",
+            "# ==========================================",
+            "# Description:",
+            f"#\t{catalog_dict['description']}",
+            "",
+            "# ---------------------------------",
+            "# Metadata:",
+            "# ---------------------------------",
+            "#\t- Catalog `.yaml` File Location:",
+            f"#\t\t{catalog_dict['yaml location']}",
+            "#\t- Recognized Names: ",
+            f"#\t\t{catalog_dict['recognized names']}",
+            "#\t- Recognized Extensions:",
+            f"#\t\t{catalog_dict['recognized extensions']}",
+            f"#\t- Created: {catalog_dict['creation time']}",
+            f"#\t- Last Modified: {catalog_dict['last modified']}",
+            "",
+            "# ---------------------------------",
+            "# Expected Parameters:",
+            "# ---------------------------------",
+        ]
         if self._typedparameterdict is not None:
+            default_parameters = catalog_dict['default parameters']
             for param, param_type in \
                     self._typedparameterdict.__annotations__.items():
-                yaml_header += f"#\t- {param}: {param_type} "
-                if param in self._catalog_dict['default parameters']:
-                    yaml_header += f"(default: "\
-                                   f"{self._catalog_dict['default parameters'][param]})\n"
+                if param in default_parameters:
+                    header_lines.append(
+                        f"#\t- {param}: {param_type} "
+                        f"(default: {default_parameters[param]})")
+                else:
+                    header_lines.append(f"#\t- {param}: {param_type}")
         else:
-            yaml_header += "#\t- None provided (arbitrary parameters)\n"
-        yaml_header += "\n# ==========================================\n\n"
+            header_lines.append("#\t- None provided (arbitrary parameters)")
+        header_lines += ["",
+                         "# ==========================================",
+                         "", ""]
+
+        return "\n".join(header_lines)
+
+
+    def _index_files(self):
+        """Moves the lists of files and of (data_label, parameter)
+        pairs read from the yaml file into the
+        `filename: (data_label, params)` dict used in memory.
+        """
+        files = self._catalog_dict.pop('files', None) or []
+        labels_params = self._catalog_dict.pop(
+            '(data_label, parameter) pairs', None) or []
+        # (interning the data labels, which are otherwise read
+        #  as a separate string for every file)
+        self._entries = {filename: (sys.intern(data_label), params)
+                         for filename, (data_label, params)
+                         in zip(files, labels_params)}
+
+        # Finding the yaml key of each file
+        self._yaml_keys = {}
+        for data_label in {data_label for data_label, _
+                           in self._entries.values()}:
+            for yaml_key, entry in \
+                    self._catalog_dict.get(data_label, {}).items():
+                self._yaml_keys[entry['filename']] = yaml_key
+
+
+    def _register_labels(self):
+        """Stores the recognized names and extensions of the
+        catalog as frozensets, for quick lookups when checking
+        new files.
+        """
+        self._recognized_names = register_labels(
+            self._catalog_dict['recognized names'])
+        self._recognized_extensions = register_labels(
+            self._catalog_dict['recognized extensions'])
+
 
-        return yaml_header
+    def _serializable_dict(self):
+        """Returns the catalog dict as it is saved, with the files
+        and their (data_label, parameter) pairs written out as
+        parallel lists.
+        """
+        return {**self._catalog_dict,
+                'files': list(self._entries),
+                '(data_label, parameter) pairs':
+                    list(self._entries.values())}
 
 
     # ---------------------------------
     # Serialization
     # ---------------------------------
     def save_serial(self):
-        """Pickle the catalog and update the yaml file."""
+        """Pickle the contents of the catalog."""
         serial_path = self._catalog_path.with_suffix(".pkl")
 
+        # (pickling only the dict of the catalog's contents: the
+        #  catalog's TypedDict class is rebuilt when loading)
         with open(serial_path, 'wb') as file:
-            pickle.dump(self, file)
+            pickle.dump(self._serializable_dict(), file,
+                        protocol=pickle.HIGHEST_PROTOCOL)
 
 
     def load_serial(self):
         """Load the catalog from an existing serialization."""
         serial_path = self._catalog_path.with_suffix(".pkl")
         with open(serial_path, 'rb') as file:
-            loaded_catalog_serial = pickle.load(file)
-
-        # Copy over relevant attributes
-        # (not including `self._verbose`)
-        self._catalog_dict = loaded_catalog_serial.catalog_dict
-
-        # Clearing the loaded catalog from memory
-        del loaded_catalog_serial
+            self._use_catalog_dict(pickle.load(file))
 
 
     # ####################################
@@ -907,9 +1372,14 @@ class Catalog:
                      nested_folder: str = None,
                      filename: str = None,
                      warn_behavior: str = None,
-                     configure: bool = sentinel):
+                     configure: bool = sentinel,
+                     save: bool = True):
         """Add a new entry to the example catalog file and returns
         the associated filename.
+
+        If `save` is False, the catalog `.yaml` file is not
+        rewritten; this allows many files to be added before
+        writing the catalog once with `save()`.
         """
         # Type checking/type casting the given parameters
         if self.configure(configure):
@@ -919,22 +1389,18 @@ class Catalog:
         # is consistent with what the catalog expects
         # to be given
         if warn_behavior is None:
-            warn_behavior = "error"
-            if self._verbose <= 20:
-                warn_behavior = "warn"
-            if self._verbose <= 10:
-                warn_behavior = "ignore"
+            warn_behavior = self._add_warn_behavior
 
         # Verifying that the file extension and parameters are valid
         check_if_recognized(file_extension,
-                            self._catalog_dict['recognized extensions'],
+                            self._recognized_extensions,
                             "file extension",
                             default_action=warn_behavior)
 
         # Checking if the data name is recognized
 
         check_if_recognized(data_label,
-                            self._catalog_dict['recognized names'],
+                            self._recognized_names,
                             "data name",
                             default_action=warn_behavior)
 
@@ -953,17 +1419,17 @@ class Catalog:
 
         # Making a key to point to the new filename in the catalog
         yaml_key = dict_to_yaml_key(params)
+        data_label = sys.intern(data_label)
 
         # Checking if the set of parameters already has an entry
-        if self._catalog_dict.get(data_label) is None:
-            # If this is the first time using this data_label,
-            # create a new entry in the catalog
-            self._catalog_dict[data_label] = {}
-        entry = self._catalog_dict[data_label].get(yaml_key)
+        # (if this is the first time using this data_label,
+        #  creating a new entry in the catalog)
+        label_entries = self._catalog_dict.setdefault(data_label, {})
+        entry = label_entries.get(yaml_key)
 
         if entry is not None:
-            file_path = Path(entry['filename'])
-            if file_path.exists():
+            file_path = entry['filename']
+            if os.path.exists(file_path):
                 if self._verbose > 0:
                     self.logger.info("Existing file with the given parameters found."
                           "\n\n\tFile path: ", file_path,
@@ -989,24 +1455,31 @@ class Catalog:
                 # parameters and continue
                 self.remove_file(filename=None,
                          data_label=data_label, params=params,
-                         delete_file=True)
-
-        # Updating the dict with the given params and filenames
-        params = dict({key: str(value) for key, value in params.items()})
-        self._catalog_dict[data_label][yaml_key] = params
+                         delete_file=True, save=False)
+            elif file_path in self._entries:
+                # If the old file is missing on disk, forgetting it,
+                # so that only the new file has this yaml key
+                self.remove_file(file_path, delete_file=False,
+                                 save=False)
 
         # Updating class information
-        self._catalog_dict['files'].append(str(filename))
-        saved_params = params.copy()
-        self._catalog_dict['(data_label, parameter) pairs'].append(
-                (data_label, saved_params))
-
-        # Adding filename and date added to catalogued file
-        self._catalog_dict[data_label][yaml_key]['filename'] = str(filename)
-        self._catalog_dict[data_label][yaml_key]['date added'] = str(now())
+        filename_str = str(filename)
+        params = {key: str(value) for key, value in params.items()}
+        self._entries[filename_str] = (data_label, params)
+        self._yaml_keys[filename_str] = yaml_key
+
+        # Updating the dict with the given params, along with the
+        # filename and date added of the catalogued file
+        label_entries[yaml_key] = {
+            **params,
+            'filename': filename_str,
+            'date added': now(),
+        }
+        self._dirty = True
 
         # Saving the updated catalog
-        self.save()
+        if save:
+            self.save()
 
         # Returning the filename
         return filename
@@ -1014,7 +1487,8 @@ class Catalog:
 
     def add_file(self, filename: str,
                  data_label: str, params: dict,
-                 configure: bool = sentinel):
+                 configure: bool = sentinel,
+                 save: bool = True):
         """An application of `new_filename` which simply takes in
         a filename, data_label, and parameters and adds them to the
         catalog.
@@ -1028,7 +1502,21 @@ class Catalog:
                                  nested_folder=None,
                                  filename=filename,
                                  warn_behavior="ignore",
-                                 configure=configure)
+                                 configure=configure,
+                                 save=save)
+
+
+    def add_files(self, files, configure: bool = sentinel):
+        """Adds several files to the catalog at once, writing the
+        catalog `.yaml` file only once at the end.
+
+        `files` is an iterable of `(filename, data_label, params)`
+        tuples; returns the list of added filenames.
+        """
+        with self.batch():
+            return [self.add_file(filename, data_label, params,
+                                  configure=configure)
+                    for filename, data_label, params in files]
 
 
     def remove_file(self, filename: str,
@@ -1051,30 +1539,35 @@ class Catalog:
             filename = self._catalog_dict[data_label][yaml_key]['filename']
         else:
             yaml_key = self.get_yaml_key(filename)
-            data_label, params = self.get_data_label_params(filename)
+            data_label = self._entries[filename][0]
 
         # Deleting the file
         if delete_file:
-            file_path = Path(filename)
-            try:
-                file_path.unlink()
-            except FileNotFoundError as exc:
-                self.logger.warn("Unable to unlink the path to the "
-                            "file you would like to remove:\n\t"
-                            + str(exc))
-            del file_path
+            self._delete_file(filename)
 
         # Removing the file metadata from the catalog
-        index = self._catalog_dict['files'].index(filename)
-        del self._catalog_dict['files'][index]
-        del self._catalog_dict['(data_label, parameter) pairs'][index]
+        del self._entries[filename]
+        del self._yaml_keys[filename]
         self._catalog_dict[data_label].pop(yaml_key)
+        self._dirty = True
 
         # Updating the catalog
         if save:
             self.save()
 
 
+    def _delete_file(self, filename):
+        """Deletes the given file from the file system, warning
+        (rather than raising an error) if it does not exist.
+        """
+        try:
+            os.unlink(filename)
+        except FileNotFoundError as exc:
+            self.logger.warn("Unable to unlink the path to the "
+                        "file you would like to remove:\n\t"
+                        + str(exc))
+
+
     # Saving figures
     def savefig(self, fig, data_label: str, params: dict,
                 file_extension: str = '.pdf',
@@ -1086,7 +1579,8 @@ class Catalog:
 
         filename = self.new_filename(data_label, params,
                                      file_extension,
-                                     nested_folder)
+                                     nested_folder,
+                                     save=kwargs.pop('save', True))
 
         if filename is None:
             return None
@@ -1106,7 +1600,7 @@ class Catalog:
         If file_filter is not None, returns all files
         consistent with the file_filter."""
         if file_filter is None:
-            return self._catalog_dict['files']
+            return list(self._entries)
         # Otherwise, if we have a file filter
         files = []
 
@@ -1119,16 +1613,17 @@ class Catalog:
             # from the file filter
             accepted_labels = file_filter.pop('data_label')
 
-        for file in self._catalog_dict['files']:
-            valid_data_label = True
+        configure = self.configure()
+        for file, (data_label, params) in self._entries.items():
+            # (checking the data label before configuring the params)
+            if accepted_labels != [] and \
+                    not equals_or_in(data_label, accepted_labels):
+                continue
+            if configure:
+                params = self.configure_parameters(params)
             try:
-                data_label, params = self.get_data_label_params(file)
-                if accepted_labels != [] and \
-                        not equals_or_in(data_label, accepted_labels):
-                    valid_data_label = False
-                if valid_data_label and \
-                     all(equals_or_in(params[key], value)
-                         for key, value in file_filter.items()):
+                if all(equals_or_in(params[key], value)
+                       for key, value in file_filter.items()):
                     files.append(file)
             except KeyError:
                 continue
@@ -1146,9 +1641,7 @@ class Catalog:
                              " None.")
 
         if filename is not None:
-            if filename in self.get_files():
-                return True
-            return False
+            return filename in self._entries
 
         if data_label is not None:
             try:
@@ -1208,11 +1701,10 @@ class Catalog:
         """Retrieve a data_label and params from the catalog dict
         from the given filename.
         """
-        if not self.has_file(filename=filename):
+        entry = self._entries.get(filename, sentinel)
+        if entry is sentinel:
             raise FileNotFoundError(f"No file {filename} in the catalog.")
-        index = self._catalog_dict['files'].index(filename)
-        data_label, params = \
-            self._catalog_dict['(data_label, parameter) pairs'][index]
+        data_label, params = entry
 
         if self.configure(configure):
             params = self.configure_parameters(params)
@@ -1223,18 +1715,13 @@ class Catalog:
         """Retrieve a data_label from the catalog dict
         from the given filename.
         """
-        return self.get_data_label_params(filename)[0]
+        return self.get_data_label_params(filename, configure=False)[0]
 
     def get_parameters(self, filename, configure=sentinel):
         """Retrieve the parameters associated with a file
         from the catalog dict from the given filename.
         """
-        params = self.get_data_label_params(filename)[1]
-
-        if self.configure(configure):
-            params = self.configure_parameters(params)
-
-        return params
+        return self.get_data_label_params(filename, configure)[1]
 
 
     def get_filename(self, data_label, params,
@@ -1246,16 +1733,10 @@ class Catalog:
             params = self.configure_parameters(params)
 
         # Checking if the data name is recognized
-        warn_behavior = "error"
-        if self._verbose < 20:
-            warn_behavior = "warn"
-        if self._verbose < 10:
-            warn_behavior = "ignore"
-
         check_if_recognized(data_label,
-                            self._catalog_dict['recognized names'],
+                            self._recognized_names,
                             "data name",
-                            default_action=warn_behavior)
+                            default_action=self._lookup_warn_behavior)
 
         # Getting info for the given params from the catalog
         yaml_key = dict_to_yaml_key(params)
@@ -1270,36 +1751,29 @@ class Catalog:
         if not self.has_file(filename=filename):
             raise FileNotFoundError(f"No file {filename} in the catalog.")
 
-        # Looping through all the dicts in the catalog
-        # which are associated with a data_label
-        for _, data_label_entries in self._catalog_dict.items():
-            if not isinstance(data_label_entries, dict):
-                continue
-            for yaml_key, entry in data_label_entries.items():
-                try:
-                    if entry['filename'] == filename:
-                        return yaml_key
-                except TypeError:
-                    continue
-        assert False, "Did not find the filename in the catalog, but " \
+        assert filename in self._yaml_keys, \
+            "Did not find the filename in the catalog, but " \
             "expected to find it: self.has_file(filename) returned True."
+        return self._yaml_keys[filename]
 
 
     def filename_from_yaml_key(self, data_label, yaml_key):
         """Retrieve a filename associated with the given
         data label and yaml key from the catalog.
         """
-        try:
-            catalog_entry = self._catalog_dict[data_label][yaml_key]
-        except KeyError as exc:
+        label_entries = self._catalog_dict.get(data_label)
+        catalog_entry = None
+        # (only the dicts of data labels hold files)
+        if isinstance(label_entries, dict):
+            catalog_entry = label_entries.get(yaml_key)
+
+        if catalog_entry is None:
             raise FileNotFoundError(
                     f"\nCatalog.filename_from_yaml_key:\n"
-                    "Ran into a KeyError when searching for a file in "
-                    f"the {self.name()} catalog's dictionary, which "
-                    "has been recast as a FileNotFoundError:\n\n"
+                    "Could not find a file when searching in "
+                    f"the {self.name()} catalog's dictionary:\n\n"
                     f"Could not find data label\n\t{data_label}\n"
-                    f"and yaml_key\n\t{yaml_key}\nin the catalog.")\
-                    from exc
+                    f"and yaml_key\n\t{yaml_key}\nin the catalog.")
 
         return catalog_entry['filename']
 
@@ -1309,7 +1783,7 @@ class Catalog:
     # ---------------------------------
     def data_labels_and_parameters(self):
         """Retrieve all data names and parameters in the catalog."""
-        return self._catalog_dict['(data_label, parameter) pairs']
+        return list(self._entries.values())
 
     def params_to_filename(self, data_label, params,
                            configure: bool = sentinel):
@@ -1324,22 +1798,23 @@ class Catalog:
         """Get the data name and parameters associated with a
         file in the catalog.
         """
-        files = self.get_files()
-        if filename not in files:
-            return None
-        labels_params = self.data_labels_and_parameters()
-        return labels_params[files.index(filename)]
+        return self._entries.get(filename)
 
 
     def closest_params(self, params: dict,
                        file_filter: dict = None,
                        configure: bool = sentinel,
-                       verbose=None):
+                       verbose=None,
+                       stop_on_perfect: bool = False):
         """Retrieve the closest parameters to the given
         parameters in the catalog.
 
         Considering only certain data_labels can be
         achieved by using file_filter.
+
+        If stop_on_perfect is True, stops searching at the
+        first file which agrees with all of the given
+        parameters (rather than collecting all such files).
         """
         if verbose is None:
             verbose = self._verbose
@@ -1353,14 +1828,23 @@ class Catalog:
         data_labels = []
         best_params = []
 
+        # (the given parameter keys/values, as a set only once)
+        param_items = set(params.items())
+
         # Looping over all relevant files
         for file in self.get_files(file_filter):
-            data_label = self.get_data_label(file)
-            file_params = self.get_parameters(file)
+            data_label, file_params = self.get_data_label_params(file)
             # Checking the number of parameter keys/values
             # that agree with the given parameter keys/values
-            agreement = len(set(params.items()).intersection(
-                            set(file_params.items())))
+            agreement = len(param_items.intersection(
+                                file_params.items()))
+
+            # Stopping at the first perfect agreement, if requested
+            if stop_on_perfect and agreement == len(params):
+                max_agreement = agreement
+                data_labels = [data_label]
+                best_params = [file_params]
+                break
 
             # If we find a new closest set of parameters,
             # update the max_agreement and best_params
@@ -1378,7 +1862,13 @@ class Catalog:
         if max_agreement == len(params):
             max_agreement = -1
 
-        if verbose > 0 and max_agreement >= 0:
+        # (the differences are only needed to report them, or
+        #  to check any files which seem to match exactly)
+        log_diffs = verbose > 0 and max_agreement >= 0
+        if not log_diffs and max_agreement >= 0:
+            return max_agreement, data_labels, best_params
+
+        if log_diffs:
             header_str = "# ------------------------------------------"
             self.logger.log(verbose, header_str)
             self.logger.log(verbose,
@@ -1403,8 +1893,13 @@ class Catalog:
 
         for label, test_params in zip(data_labels,
                                       best_params):
-            diff = dictdiff(params, test_params)
-            if verbose > 0 and max_agreement >= 0:
+            # (parameters in perfect agreement with as many
+            #  items as the given parameters are identical)
+            if max_agreement == -1 and len(test_params) == len(params):
+                diff = []
+            else:
+                diff = dictdiff(params, test_params)
+            if log_diffs:
                 self.logger.log(verbose, f"\t* {label = } (len = "
                            f"{len(test_params)}): {diff}")
 
@@ -1413,7 +1908,7 @@ class Catalog:
             # perform assertions to ensure that the catalog
             # has the file with the params given as an argument
             # to closest file
-            if diff == set():
+            if not diff:
                 can_find_file = self.has_file(data_label=label,
                                               params=params)
                 assert can_find_file and max_agreement == -1,\
@@ -1428,7 +1923,7 @@ class Catalog:
                        "parameters:\n\t"\
                        f"data_label = {label}\n\t{params=}"\
 
-        if verbose > 0 and max_agreement >= 0:
+        if log_diffs:
             self.logger.log(verbose, "\n"+header_str+"\n")
 
 
@@ -1443,10 +1938,40 @@ class Catalog:
         """Removes all files from the catalog
         that fit the given file filter dict.
         """
-        for filename in self.get_files(file_filter):
-            self.remove_file(filename=filename, save=False)
+        # (a set, so that the catalog's own list of files
+        #  is not modified while we loop over it)
+        purged_files = set(self.get_files(file_filter))
+        if not purged_files:
+            return
+
+        # Removing the file metadata from the catalog
+        # before deleting anything
+        # (several filenames may share a yaml key, so only
+        #  removing entries which still point to the file)
+        for filename in purged_files:
+            label_entries = self._catalog_dict[self._entries[filename][0]]
+            yaml_key = self._yaml_keys.pop(filename)
+            if label_entries.get(yaml_key, {}).get('filename') == filename:
+                del label_entries[yaml_key]
+
+        self._entries = {filename: label_params
+                         for filename, label_params
+                         in self._entries.items()
+                         if filename not in purged_files}
+        self._dirty = True
         self.save()
 
+        # Deleting the files
+        # (for large purges, overlapping the deletions, since
+        #  they are dominated by file system latency)
+        if len(purged_files) > PARALLEL_DELETE_THRESHOLD:
+            with ThreadPoolExecutor() as executor:
+                for _ in executor.map(self._delete_file, purged_files):
+                    pass
+        else:
+            for filename in purged_files:
+                self._delete_file(filename)
+
 
     def transmute_parameter(self, old_param_name: str,
                             new_param_name: str=None,
@@ -1586,26 +2111,34 @@ class Catalog:
         if erase_old_param:
             # Removing the old parameter from the
             # TypedDict class of catalog parameter types
-            # and the default parameters
+            # (by rebuilding the class) and the default parameters
+            parameter_dict = typeddict_to_stringdict(
+                self._typedparameterdict)
+            parameter_dict.pop(old_param_name, None)
+            self._typedparameterdict = stringdict_to_typeddict(
+                self._typedparameterdict.__name__, parameter_dict)
+
             for class_dict in \
-                    [self._typedparameterdict.__annotations__,
-                     self._catalog_dict['parameter types'],
+                    [self._catalog_dict['parameter types'],
                      self._catalog_dict['default parameters']]:
                 try:
                     class_dict.pop(old_param_name)
                 except KeyError:
                     pass
+            self._dirty = True
 
         # Add the new parameters types and defaults
         # to the catalog class information
+        # (saving only once, after all files are updated)
         if new_params_are_listlike:
             self.add_parameter_defaults(
                 new_parameters=dict(zip(new_param_name, new_param_type)),
-                defaults=dict(zip(new_param_name, default)))
+                defaults=dict(zip(new_param_name, default)),
+                save=False)
         else:
             self.add_parameter_default(new_param_name,
                                        new_param_type,
-                                       default)
+                                       default, save=False)
 
         # ====================================
         # Looping over files to transmute the parameters
@@ -1671,41 +2204,37 @@ class Catalog:
             params = self.configure_parameters(params)
 
         # Finding the file with the given data label and params
-        try:
-            file_index = self._catalog_dict['files'].index(filename)
-        except ValueError as exc:
-            # Raised if data_label and/or params are given
-            # and invalid.
-            # (A different FileNotFoundError is raised by
-            #  self.get_data_label(filename) if the filename
-            #  is given but invalid)
+        # (A different FileNotFoundError is raised by
+        #  self.get_data_label(filename) if the filename
+        #  is given but invalid)
+        if filename not in self._entries:
             raise FileNotFoundError("No file with the given "
                                     "filename found,\n\t"
-                                    f"{filename = }") from exc
+                                    f"{filename = }")
 
         # ====================================
         # Updating the catalog
         # ====================================
         # Updating the (data_label, param) pair for the file
-        old_data_label, old_params = \
-            self._catalog_dict['(data_label, parameter) pairs']\
-                [file_index]
-
-        self._catalog_dict['(data_label, parameter) pairs']\
-            [file_index] = (data_label, params)
+        old_data_label, _ = self._entries[filename]
+        self._entries[filename] = (data_label, params)
 
         # ------------------------------------
         # Updating the string yaml key
         # ------------------------------------
-        old_yaml_key = dict_to_yaml_key(old_params)
+        # (using the stored key, rather than rebuilding it)
+        old_yaml_key = self._yaml_keys[filename]
         old_yaml_params = self._catalog_dict[old_data_label].pop(
                 old_yaml_key)
 
         new_yaml_key = dict_to_yaml_key(params)
-        new_yaml_params = params.copy()
-        for key in ['filename', 'date added']:
-            new_yaml_params[key] = old_yaml_params[key]
-        self._catalog_dict[data_label][new_yaml_key] = new_yaml_params
+        self._catalog_dict[data_label][new_yaml_key] = {
+            **params,
+            'filename': old_yaml_params['filename'],
+            'date added': old_yaml_params['date added'],
+        }
+        self._yaml_keys[filename] = new_yaml_key
+        self._dirty = True
 
         if kwargs.get('save', True):
             self.save()
@@ -1713,11 +2242,27 @@ class Catalog:
 
     def add_parameter_default(self, new_parameter,
                               parameter_type,
-                              default_value=sentinel):
+                              default_value=sentinel,
+                              save: bool = True):
         """Add a new parameter with a default value to the catalog."""
+        self._stage_parameter_default(new_parameter, parameter_type,
+                                      default_value)
+        self._update_typeddict()
+
+        # Updating the catalog
+        if save:
+            self.save()
+
+
+    def _stage_parameter_default(self, new_parameter,
+                                 parameter_type,
+                                 default_value=sentinel):
+        """Records the type and default value of a new parameter,
+        without rebuilding the TypedDict class of the catalog
+        (see `_update_typeddict`).
+        """
         if self._typedparameterdict is not None:
-            existing_params = typeddict_to_stringdict(
-                self._typedparameterdict)
+            existing_params = self._typedparameterdict.__annotations__
             if new_parameter in existing_params:
                 self.logger.debug("Catalog.add_parameter_default:"
                              f"\tParameter {new_parameter} already "
@@ -1734,30 +2279,29 @@ class Catalog:
                              "problems with backwards "
                              "compatibility.")
 
-        # Preparing the typeddict if it doesn't exist
-        if self._typedparameterdict is None:
-            self._typedparameterdict = {}
-
-        # Updating the TypedDict class constraining
-        # the parameters of the catalog's files
-        parameter_dict = typeddict_to_stringdict(
-            self._typedparameterdict)
-        parameter_dict.update({new_parameter: parameter_type})
-        self._typedparameterdict = stringdict_to_typeddict(
-            self._typedparameterdict.__name__, parameter_dict)
+        # Preparing the parameter types if there are none yet
+        if self._catalog_dict['parameter types'] is None:
+            self._catalog_dict['parameter types'] = {}
 
         self._catalog_dict['parameter types'][new_parameter] = \
             parameter_type
 
         # Updating the default parameters
         self._catalog_dict['default parameters'].update({new_parameter: default_value})
+        self._dirty = True
 
-        # Updating the catalog
-        self.save()
+
+    def _update_typeddict(self):
+        """Rebuilds the TypedDict class constraining the parameters
+        of the catalog's files from the catalog's parameter types.
+        """
+        self._typedparameterdict = stringdict_to_typeddict(
+            f"{self._catalog_name}_parameters",
+            self._catalog_dict['parameter types'])
 
 
     def add_parameter_defaults(self, new_parameters,
-                       defaults=None):
+                       defaults=None, save: bool = True):
         """Add the given parameters to the TypedDict
         describing the parameters associated with the
         catalog.
@@ -1781,9 +2325,15 @@ class Catalog:
                              "parameters being added.")
 
         # Updating this Catalog's TypedDict class
+        # (only once, after all parameters are recorded)
         for new_param, new_type in new_parameters.items():
             default = defaults.get(new_param)
-            self.add_parameter_default(new_param, new_type, default)
+            self._stage_parameter_default(new_param, new_type, default)
+        self._update_typeddict()
+
+        # Updating the catalog
+        if save:
+            self.save()
 
 
     def remove_parameter_default(self, parameter):
@@ -1792,8 +2342,13 @@ class Catalog:
             raise ValueError(f"Parameter {parameter} not found in "
                              "the catalog's default parameters.")
         self._catalog_dict['default parameters'].pop(parameter)
-        self._typedparameterdict.__annotations__.pop(parameter)
+        parameter_dict = typeddict_to_stringdict(
+            self._typedparameterdict)
+        parameter_dict.pop(parameter)
+        self._typedparameterdict = stringdict_to_typeddict(
+            self._typedparameterdict.__name__, parameter_dict)
         self._catalog_dict['parameter types'].pop(parameter)
+        self._dirty = True
         self.save()
 
 
@@ -1802,74 +2357,38 @@ class Catalog:
         """Updates all yaml keys of files in the catalog
         as dictated by the parameters recorded for each file.
         """
-        # Looping over all files in the catalog
-        for file in self.get_files(file_filter):
+        # Removing the entries of the files under their old yaml
+        # keys (all of them first, so that the new yaml key of one
+        # file never overwrites an entry which is yet to be updated)
+        updated_files = []
+        for filename in self.get_files(file_filter):
             # Getting file parameters
-            data_label, params = self.get_data_label_params(file,
+            data_label, params = self.get_data_label_params(filename,
                                         configure=configure_params)
-
-            # Recording whether we could successfully update the
-            # file's yaml key in the catalog
-            found_yaml_key = False
-
-            # Looping over yaml keys to find one associated with
-            # the old parameters for this file
-            catalog_dict_entry = self._catalog_dict[data_label].copy()
-            for old_yaml_key, old_yaml_params in catalog_dict_entry.items():
-                # Preparing parameters
-                if not isinstance(old_yaml_params, dict):
-                    continue
-
-                try:
-                    filename = old_yaml_params.pop('filename')
-                    date_added = old_yaml_params.pop('date added')
-                except KeyError as exc:
-                    self.logger.error("Catalog.update_yaml_keys:\n\t"
-                        f"yaml KeyError for\n{old_yaml_params}")
-                    raise exc
-
-                if self.configure(configure_params):
-                    old_yaml_params = self.configure_parameters(old_yaml_params)
-
-                # Looking for parameters matching the file
-                if old_yaml_params == params:
-                    new_yaml_params = params.copy()
-                    new_yaml_params['filename'] = filename
-                    new_yaml_params['date added'] = date_added
-
-                    new_yaml_key = dict_to_yaml_key(params)
-
-                    self._catalog_dict[data_label].pop(old_yaml_key)
-                    self._catalog_dict[data_label][new_yaml_key] = \
-                            new_yaml_params
-
-                    found_yaml_key = True
-                    break
-
-            if not found_yaml_key:
-                raise AssertionError("Was unable to find a yaml key "
-                    "whose value in the catalog dict is one of the "
-                    f"expected parameters:\n{params=}")
-            # If we did not find any yaml key for the old parameters,
-            # something went wrong -- there should definitely be
-            # a yaml key associated with any filename in the catalog
-            if not found_yaml_key:
-                label_filter = {'data_label': data_label}
-                _ = self.closest_params(params=params,
-                                        file_filter=label_filter,
-                                        configure=configure,
-                                        verbose=40)
-                raise AssertionError("Catalog.update_yaml_keys:\n\n"
-                    "When attempting to update the yaml key "
-                    f"in the {self.name()} catalog for the file "
-                    f"with\n\t{data_label=}\n\t{params=},\n"
-                    "was unable to find a yaml key "
-                    "corresponding to the file parameters "
-                    "in the catalog's dictionary.\n"
-                    "Since any filename in the catalog should "
-                    "be associated with the yaml key, this is "
-                    "very unexpected behavior.")
-
+            # (leaving files whose yaml key does not change alone)
+            new_yaml_key = dict_to_yaml_key(params)
+            old_yaml_key = self._yaml_keys[filename]
+            if new_yaml_key == old_yaml_key:
+                continue
+            old_yaml_params = self._catalog_dict[data_label].pop(
+                old_yaml_key)
+            updated_files.append((filename, data_label, params,
+                                  new_yaml_key,
+                                  old_yaml_params['date added']))
+
+        # Adding the entries back under the yaml keys dictated by
+        # their parameters
+        for filename, data_label, params, new_yaml_key, date_added \
+                in updated_files:
+            self._catalog_dict[data_label][new_yaml_key] = {
+                **params,
+                'filename': filename,
+                'date added': date_added,
+            }
+            self._yaml_keys[filename] = new_yaml_key
+
+        if updated_files:
+            self._dirty = True
         self.save()
 
 
@@ -1896,8 +2415,25 @@ class Catalog:
             # just return the given parameters
             return parameters
 
+        # Re-using the result for previously configured parameters
+        # (also keyed on the current defaults and parameter types,
+        #  since the defaults may be modified in place, e.g. through
+        #  `default_parameters()`)
+        defaults = self._catalog_dict['default parameters']
+        cache_key = _cache_key(parameters)
+        defaults_key = _cache_key(defaults)
+        if cache_key is not None and defaults_key is not None:
+            cache_key = (cache_key, defaults_key,
+                         self._typedparameterdict)
+            typedparameters = self._configured_params.get(cache_key)
+            if typedparameters is not None:
+                # (as a copy, since callers may modify it)
+                return typedparameters.copy()
+        else:
+            cache_key = None
+
         # Setting up the parameters with default values
-        typedparameters = self._catalog_dict['default parameters'].copy()
+        typedparameters = defaults.copy()
         typedparameters.update(parameters)
 
         # Casting to the TypeDict associated with this catalog
@@ -1910,7 +2446,7 @@ class Catalog:
                             # TypedDict for typechecking
                             typeddict=self._typedparameterdict,
                             # Default parameters from init
-                            defaults=self._catalog_dict['default parameters'],
+                            defaults=defaults,
                             # Whether to allow undefined params
                             allow_undeclared_keys=self._allow_undeclared_parameters)
         except (ValueError, TypeError) as exc:
@@ -1918,6 +2454,12 @@ class Catalog:
                         f"{self._catalog_dict['name']}")
             raise exc
 
+        # Only caching results without mutable values
+        # (e.g. list-valued parameters), which a copy would share
+        if cache_key is not None and _cache_key(typedparameters) is not None:
+            if len(self._configured_params) >= _CONFIGURED_CACHE_SIZE:
+                self._configured_params.clear()
+            self._configured_params[cache_key] = typedparameters.copy()
         return typedparameters
 
 
@@ -1943,21 +2485,16 @@ class Catalog:
         """Returns the set of required parameters
         for the catalog.
         """
-        parameters = self.expected_parameters()
-        optional_parameters = self.optional_parameters()
-        [parameters.remove(param)
-         for param in optional_parameters]
-        return parameters
+        return self.expected_parameters() - self.optional_parameters()
 
     def required_parameter_types(self):
         """Returns the expected types for each
         required parameter.
         """
-        parameter_types = self.expected_parameter_types()
         optional_parameters = self.optional_parameters()
-        [parameter_types.pop(param)
-         for param in optional_parameters]
-        return parameter_types
+        return {key: param_type for key, param_type
+                in self.expected_parameter_types().items()
+                if key not in optional_parameters}
 
 
     # Optional parameters (parameters with default values)
@@ -1972,7 +2509,7 @@ class Catalog:
         optional parameter.
         """
         return {key: self._typedparameterdict.__annotations__[key]
-                for key in self._catalog_dict['default parameters'].keys()}
+                for key in self._catalog_dict['default parameters']}
 
     def optional_parameter_values(self):
         """Returns the default values for each
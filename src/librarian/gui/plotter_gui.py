@@ -480,13 +480,14 @@ class PlotterGUI():
             catalog_dict = catalog.as_dict()
             catalog_parameters = catalog_dict["parameter types"].keys()
             parameters = list(set(list(parameters) + list(catalog_parameters)))
-            # Updating the catalog's default values with the given default values
+            # Overriding the catalog's default values with the given
+            # default values (`as_dict` returns a copy, so this does
+            # not change the catalog itself)
             catalog_defaults = catalog_dict["default parameters"]
             if catalog_defaults is None:
                 catalog_defaults = {}
             catalog_defaults.update(defaults)
-            defaults = catalog_defaults.copy()
-            del catalog_defaults  # Preventing use of catalog_defaults
+            defaults = catalog_defaults
 
         # ====================================
         # Filling Parameters in the GUI w/o Grouping
@@ -0,0 +1,303 @@
+import os
+import pickle
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from librarian.catalog import Catalog, dict_to_yaml_key, \
+    LOAD_DEFAULT_ENV_VAR
+
+# =====================================
+# Setup
+# =====================================
+
+def new_catalog(catalog_dir=None, **kwargs):
+    """Creates a new, empty catalog in a temporary directory."""
+    if catalog_dir is None:
+        catalog_dir = tempfile.mkdtemp()
+    kwargs.setdefault('description', 'A catalog for testing')
+    kwargs.setdefault('recognized_names', ['label'])
+    kwargs.setdefault('parameters', {'a': 'int'})
+    kwargs.setdefault('verbose', 0)
+    kwargs.setdefault('load', 'never')
+    return Catalog('test_catalog', catalog_dir, **kwargs)
+
+
+def touch(filename):
+    """Creates an empty file."""
+    with open(filename, 'w', encoding='utf8'):
+        pass
+
+
+# =====================================
+# Tests
+# =====================================
+
+# ---------------------------------
+# Adding and removing files
+# ---------------------------------
+def test_replace_missing_file():
+    """A file whose entry points to a file missing on disk
+    replaces that entry, and removing the old file afterwards
+    leaves the new one in the catalog.
+    """
+    catalog = new_catalog()
+    catalog.add_file('x.txt', 'label', {'a': 5})
+    catalog.add_file('y.txt', 'label', {'a': 5})
+
+    assert not catalog.has_file(filename='x.txt')
+    assert catalog.get_filename('label', {'a': 5}) == 'y.txt'
+
+    try:
+        catalog.remove_file('x.txt', delete_file=False)
+        raise AssertionError("Removed a file which was replaced.")
+    except FileNotFoundError:
+        pass
+
+    assert catalog.has_file(data_label='label', params={'a': 5})
+    assert catalog.get_files() == ['y.txt']
+
+
+def test_purge():
+    """Purging removes the files from both the catalog and the
+    disk, including for purges large enough to run in parallel.
+    """
+    catalog = new_catalog()
+    for a in range(50):
+        touch(catalog.new_filename('label', {'a': a}, '.txt'))
+    kept = catalog.get_filename('label', {'a': 0})
+
+    catalog.purge({'a': list(range(1, 50))})
+
+    assert catalog.get_files() == [kept]
+    assert {f for f in os.listdir(catalog.dir())
+            if f.endswith('.txt')} == {os.path.basename(kept)}
+    reloaded = Catalog('test_catalog', catalog.dir(), load='required',
+                       verbose=0)
+    assert reloaded.get_files() == [kept]
+
+
+def test_purge_shared_yaml_key():
+    """Purging files which share a yaml key removes their
+    metadata before deleting anything.
+    """
+    catalog = new_catalog()
+    first = catalog.new_filename('label', {'a': 1}, '.txt')
+    second = catalog.new_filename('label', {'a': 2}, '.txt')
+    touch(first)
+    touch(second)
+    # (both files pointing to the same yaml key)
+    catalog._yaml_keys[second] = catalog._yaml_keys[first]
+
+    catalog.purge()
+
+    assert catalog.get_files() == []
+    assert not os.path.exists(first) and not os.path.exists(second)
+
+
+def saved_files(catalog):
+    """Returns the files in the catalog `.yaml` file on disk."""
+    return Catalog(catalog.name(), catalog.dir(), load='required',
+                   verbose=0).get_files()
+
+
+# ---------------------------------
+# Batching changes
+# ---------------------------------
+def test_batch():
+    """Within a batch, the catalog is only saved at the end of the
+    batch, or when forced.
+    """
+    catalog = new_catalog()
+    with catalog.batch():
+        catalog.add_file('x.txt', 'label', {'a': 1})
+        with catalog:
+            catalog.add_file('y.txt', 'label', {'a': 2})
+        assert saved_files(catalog) == []
+        catalog.save(force=True)
+        assert saved_files(catalog) == ['x.txt', 'y.txt']
+        catalog.add_file('z.txt', 'label', {'a': 3})
+        assert saved_files(catalog) == ['x.txt', 'y.txt']
+    assert saved_files(catalog) == ['x.txt', 'y.txt', 'z.txt']
+
+
+def test_batch_error():
+    """A batch interrupted by an error is not saved."""
+    catalog = new_catalog()
+    try:
+        with catalog:
+            catalog.add_file('x.txt', 'label', {'a': 1})
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert catalog.get_files() == ['x.txt']
+    assert saved_files(catalog) == []
+
+    catalog.save()
+    assert saved_files(catalog) == ['x.txt']
+
+
+def test_add_files():
+    """`add_files` adds all of the given files at once."""
+    catalog = new_catalog()
+    filenames = catalog.add_files([('x.txt', 'label', {'a': 1}),
+                                   ('y.txt', 'label', {'a': '2'})])
+    assert filenames == ['x.txt', 'y.txt']
+    assert catalog.get_filename('label', {'a': 2}) == 'y.txt'
+    assert saved_files(catalog) == ['x.txt', 'y.txt']
+
+
+# ---------------------------------
+# Parameters
+# ---------------------------------
+def test_yaml_key_equal_values():
+    """Values which compare equal but are written differently
+    have different yaml keys.
+    """
+    assert dict_to_yaml_key({'a': 0.0}) == 'a : 0.0'
+    assert dict_to_yaml_key({'a': -0.0}) == 'a : -0.0'
+    assert dict_to_yaml_key({'a': 1}) == 'a : 1'
+    assert dict_to_yaml_key({'a': True}) == 'a : True'
+
+
+def test_configure_parameters_copies():
+    """Configured parameters can be modified by the caller, and
+    reflect changes to the default parameters.
+    """
+    catalog = new_catalog(parameters={'a': 'int', 'l': 'list'},
+                          default_parameters={'a': 1})
+
+    configured = catalog.configure_parameters({'l': 'p,q'})
+    configured['l'].append('z')
+    configured['a'] = 2
+    assert catalog.configure_parameters({'l': 'p,q'}) \
+        == {'a': 1, 'l': ['p', 'q']}
+
+    catalog = new_catalog(parameters={'a': 'int', 'b': 'int'},
+                          default_parameters={'a': 1})
+    assert catalog.configure_parameters({'b': 2}) == {'a': 1, 'b': 2}
+    catalog.default_parameters()['a'] = 3
+    assert catalog.configure_parameters({'b': 2}) == {'a': 3, 'b': 2}
+
+
+# ---------------------------------
+# Catalog metadata
+# ---------------------------------
+def test_as_dict_copy():
+    """Changing the dict returned by `as_dict` does not change
+    the catalog.
+    """
+    catalog = new_catalog(default_parameters={'a': 1})
+    catalog.add_file('x.txt', 'label', {'a': 2})
+
+    catalog_dict = catalog.as_dict()
+    assert catalog_dict['files'] == ['x.txt']
+    catalog_dict['default parameters']['a'] = 3
+    catalog_dict['files'].append('y.txt')
+
+    assert catalog.default_parameters() == {'a': 1}
+    assert catalog.get_files() == ['x.txt']
+    assert catalog.as_dict()['default parameters'] == {'a': 1}
+
+
+
+# ---------------------------------
+# Saving and loading
+# ---------------------------------
+def test_load_default_env():
+    """The environment variable LIBRARIAN_LOAD_DEFAULT replaces
+    the default `load='ask'`.
+    """
+    catalog = new_catalog()
+    catalog.add_file('x.txt', 'label', {'a': 1})
+
+    old_value = os.environ.get(LOAD_DEFAULT_ENV_VAR)
+    try:
+        os.environ[LOAD_DEFAULT_ENV_VAR] = 'always'
+        assert Catalog(catalog.name(), catalog.dir(),
+                       verbose=0).get_files() == ['x.txt']
+        os.environ[LOAD_DEFAULT_ENV_VAR] = 'never'
+        assert new_catalog(catalog.dir(),
+                           load='ask').get_files() == []
+    finally:
+        if old_value is None:
+            os.environ.pop(LOAD_DEFAULT_ENV_VAR, None)
+        else:
+            os.environ[LOAD_DEFAULT_ENV_VAR] = old_value
+
+
+def test_yaml_cache():
+    """The cache of the catalog .yaml file is only written and
+    used with `cache_yaml=True`, and only for the .yaml file it
+    was written for.
+    """
+    catalog = new_catalog()
+    catalog.add_file('x.txt', 'label', {'a': 1})
+    cache_path = os.path.join(catalog.dir(),
+                              f".{catalog.name()}.cache.pkl")
+    assert not os.path.exists(cache_path)
+
+    catalog = new_catalog(catalog.dir(), cache_yaml=True)
+    catalog.add_file('x.txt', 'label', {'a': 1})
+    assert os.path.exists(cache_path)
+    assert Catalog(catalog.name(), catalog.dir(), load='required',
+                   cache_yaml=True, verbose=0).get_files() == ['x.txt']
+
+    # Replacing the contents of the cache
+    with open(cache_path, 'rb') as cache:
+        digest, catalog_dict = pickle.load(cache)
+    catalog_dict['files'] = ['y.txt']
+    for cached_digest in [digest, b'not the digest']:
+        with open(cache_path, 'wb') as cache:
+            pickle.dump((cached_digest, catalog_dict), cache)
+        files = Catalog(catalog.name(), catalog.dir(), load='required',
+                        cache_yaml=True, verbose=0).get_files()
+        # (the cache is only used for the matching .yaml file)
+        assert files == (['y.txt'] if cached_digest == digest
+                         else ['x.txt'])
+
+    # (without `cache_yaml`, the cache is never used)
+    with open(cache_path, 'wb') as cache:
+        pickle.dump((digest, catalog_dict), cache)
+    assert saved_files(catalog) == ['x.txt']
+
+
+def test_locking():
+    """Saving the catalog waits for other processes holding a
+    lock on the catalog, and loading it does not wait for other
+    readers.
+    """
+    if fcntl is None:
+        return
+    catalog = new_catalog()
+    lock_path = os.path.join(catalog.dir(), f".{catalog.name()}.lock")
+
+    with open(lock_path, 'a', encoding='utf8') as lock_file:
+        # Other readers
+        fcntl.flock(lock_file, fcntl.LOCK_SH)
+        assert saved_files(catalog) == []
+
+        saving = threading.Thread(
+            target=catalog.add_file, args=('x.txt', 'label', {'a': 1}))
+        saving.start()
+        saving.join(timeout=0.2)
+        assert saving.is_alive()
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        saving.join()
+
+    assert saved_files(catalog) == ['x.txt']
+
+
+# =====================================
+# Implementation
+# =====================================
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"{name}: passed")